@@ -1,9 +1,9 @@
 """
 Parent class to create audio cues for a specific book.
 """
-import time
 import os
 import random
+import re
 import pygame
 
 class BookSession():
@@ -19,20 +19,52 @@ class BookSession():
             names for sound effect related cues.
         _music_keys: A list of strings representing all the category names for
             background music related cues.
-        _location: A list containing two strings representing the path
+        _location: A tuple containing two strings representing the path
             containing the files from which one is to be randomly returned.
             Here, the first string represents the directory "Sound_Effects"
             or "Music", while the second string represents the more narrow
             category name, such as "Clock" or "Fire".
+        _category: A dictionary mapping each category name (key) to the
+            directory it lives in, "Sound_Effects" or "Music", so finding a
+            location does not scan the key lists.
+        _sound_effect_set: A set holding the same category names as
+            '_sound_effect_keys', for constant-time membership tests when
+            classifying a category not yet in '_category'.
+        _pattern: A compiled regular expression matching every audio cue in
+            '_key_words', with one named group per category so a match can be
+            traced back to its category name. Set to None when cues have been
+            added and the pattern has not been rebuilt yet.
+        _group_to_key: A dictionary mapping the generated group names in
+            '_pattern' back to the category names (keys) in '_key_words'.
+        _word_to_key: A dictionary mapping each audio cue directly to its
+            category name (key), used to answer exact-cue texts with a single
+            lookup instead of a scan.
+        _index: A dictionary mapping each category name to a tuple of the
+            audio file names in its directory, built once at session start so
+            picking a file never touches the filesystem.
+        _pick_buffer: A dictionary mapping each category name to a list of
+            upcoming random file picks, drawn in batches so the random number
+            generator runs once per batch instead of once per cue.
+        _sounds: A dictionary mapping locations (as tuples of two strings) to
+            lists of 'pygame.mixer.Sound' instances decoded from every audio
+            file in that directory, so playback does not open or decode files
+            while the user is reading.
+        _mixer_ready: A boolean representing whether pygame and its mixer
+            have been initialized and the audio files decoded yet. This is
+            deferred until the first cue plays so menus and keyword checks do
+            not pay the audio start-up cost.
+        _key_priority: A dictionary mapping each category name (key) in
+            '_key_words' to an integer representing its position in the
+            dictionary, used to rank matches when more than one cue is found.
     """
     def __init__(self):
         """
-        Initialize the session by initializing pygame's music and adding basic
-        audio cues to the dictionary and lists.
+        Initialize the session by adding basic audio cues to the dictionary
+        and lists. Pygame's mixer is only initialized once the first cue
+        plays (see 'play_audio').
         """
-        # Initalize pygame and pygame's music mixer
-        pygame.init()
-        pygame.mixer.init()
+        self._mixer_ready = False
+        self._sounds = {}
 
         self._key_words = {"Beginning": ["once upon a time", \
             "happily ever after"], "Huff": ["huffed", "huff", "hoff"], \
@@ -42,7 +74,85 @@ class BookSession():
         self._sound_effect_keys = ["Huff", "Fire", "Footsteps", "Laughter", \
             "Horse", "Clock", "Knock"]
         self._music_keys = ["Beginning", "Sad"]
-        self._location = []
+        self._sound_effect_set = set(self._sound_effect_keys)
+        self._category = {key: "Sound_Effects" \
+            for key in self._sound_effect_keys}
+        self._category.update({key: "Music" for key in self._music_keys})
+        self._location = ()
+        self._pick_buffer = {}
+        self._build_pattern()
+        self._build_index()
+
+    def _build_index(self):
+        """
+        Index every audio file under 'Audio/' once at session start.
+
+        '_index' is set to a dictionary mapping each category name to a tuple
+        of the audio file names in its directory, leaving out hidden files.
+        '_category' also gains an entry for each category found on disk, so
+        categories a subclass adds later are still classified correctly.
+        """
+        self._index = {}
+
+        for folder in ("Sound_Effects", "Music"):
+            with os.scandir(f"Audio/{folder}") as categories:
+                category_names = [entry.name for entry in categories \
+                    if entry.is_dir()]
+
+            for category in category_names:
+                with os.scandir(f"Audio/{folder}/{category}") as entries:
+                    self._index[category] = tuple(entry.name \
+                        for entry in entries if not entry.name.startswith("."))
+                self._category.setdefault(category, folder)
+
+    def _preload_sounds(self):
+        """
+        Decode every audio file in the index into pygame Sound objects.
+
+        '_sounds' is set to a dictionary mapping locations (tuples of two
+        strings, in the same form as '_location') to lists of
+        'pygame.mixer.Sound' instances, one per file in '_index'. This is done
+        once so that playing a cue later does not have to open and decode a
+        file first.
+        """
+        self._sounds = {}
+
+        for category, file_names in self._index.items():
+            folder = self._category[category]
+            self._sounds[(folder, category)] = \
+                [pygame.mixer.Sound(f"Audio/{folder}/{category}/{file_name}") \
+                for file_name in file_names]
+
+    def _build_pattern(self):
+        """
+        Compile the keyword-matching pattern from the audio cues in
+        '_key_words'.
+
+        '_pattern' is set to a single compiled regular expression made of one
+        named group of alternatives per category. Group names are generated as
+        'key_0', 'key_1', and so on, since category names are not guaranteed
+        to be valid group identifiers, and '_group_to_key' maps them back to
+        the category names. '_key_priority' is set to a dictionary mapping
+        each category name to its position in '_key_words', and '_word_to_key'
+        to a dictionary mapping each cue back to its category name. When
+        '_key_words' changes, 'add_key_word' sets '_pattern' to None and this
+        runs again on the next 'check_for_key_word' call.
+        """
+        self._group_to_key = {}
+        self._key_priority = {}
+        self._word_to_key = {}
+        groups = []
+
+        for priority, (key, words) in enumerate(self._key_words.items()):
+            group_name = f"key_{priority}"
+            self._group_to_key[group_name] = key
+            self._key_priority[key] = priority
+            for word in words:
+                self._word_to_key.setdefault(word, key)
+            groups.append(f"(?P<{group_name}>" + \
+                "|".join(re.escape(word) for word in words) + ")")
+
+        self._pattern = re.compile("|".join(groups))
 
     def get_sound_effect_keys(self):
         """
@@ -69,8 +179,8 @@ class BookSession():
         Get the location for the audio file currently being discussed.
 
         Returns:
-        A list (length 2) of strings representing the two folders inside which
-        the audio files for the category (key) inputted exist.
+        A tuple (length 2) of strings representing the two folders inside
+        which the audio files for the category (key) inputted exist.
         """
         return self._location
 
@@ -80,7 +190,9 @@ class BookSession():
         which one is present.
 
         If there is more than one cue present in the text, only the first one's
-        category (key) will be returned.
+        category (key) will be returned. The text is lowercased and stripped
+        once before matching, so the case and padding of the transcription do
+        not affect the result.
 
         Args:
             transcribed_text: A string representing the text to check for audio
@@ -91,11 +203,30 @@ class BookSession():
         mapping to the audio cue that was first found in the text and None if
         there are no cues present.
         """
-        for key, value in self._key_words.items():
-            for word in value:
-                if word in transcribed_text:
-                    return key
-        return None
+        # Rebuild the matching structures if cues were added since the last
+        # check
+        if self._pattern is None:
+            self._build_pattern()
+
+        # Normalize the text once so matching is not thrown off by case or
+        # padding; the cues themselves are stored lowercased
+        text = transcribed_text.lower().strip()
+
+        # Fast path: a text that is exactly one of the cues (common for short
+        # utterances) needs only a dictionary lookup, not a scan
+        found_key = self._word_to_key.get(text)
+        if found_key is not None:
+            return found_key
+
+        # Scan the text once, keeping the match whose category appears
+        # earliest in the dictionary
+        for match in self._pattern.finditer(text):
+            key = self._group_to_key[match.lastgroup]
+            if found_key is None or \
+                self._key_priority[key] < self._key_priority[found_key]:
+                found_key = key
+
+        return found_key
 
     def find_audio_location(self, key):
         """
@@ -110,68 +241,102 @@ class BookSession():
         'Audio/Sound_Effects/Clock'. Therefore, ["Sound_Effects", "Clock"] is
         returned.
 
-        '_location' is set to a list (length 2) of strings representing the two
-        folders inside which the audio files for the category (key) inputted
-        exist.
+        '_location' is set to a tuple (length 2) of strings representing the
+        two folders inside which the audio files for the category (key)
+        inputted exist.
 
         Args:
             key: A string representing the name of the category for which the
                 location is to be found.
         """
-        location = []
+        folder = self._category.get(key)
 
-        # Pick whether the folder is Sound_Effects or Music
-        if key in self._sound_effect_keys:
-            location = location + ["Sound_Effects"]
-        else:
-            location = location + ["Music"]
+        # Categories added after startup (ex: by a subclass) are classified
+        # once here and remembered
+        if folder is None:
+            # Refresh the set if the key list has grown since it was built
+            if len(self._sound_effect_set) != len(self._sound_effect_keys):
+                self._sound_effect_set = set(self._sound_effect_keys)
 
-        # Pick the nested folder
-        location = location + [key]
+            if key in self._sound_effect_set:
+                folder = "Sound_Effects"
+            else:
+                folder = "Music"
+            self._category[key] = folder
 
-        self._location = location
+        self._location = (folder, key)
 
     def pick_random_audio(self):
         """
         Return a random file from the folder given through the '_location'.
 
+        The file names come from the index built at session start, so no
+        directory is read here, and picks are drawn in batches of 16 (with
+        replacement, like repeated single picks) so the random number
+        generator only runs once per batch.
+
         Returns:
         A string representing the name of a random file inside the path
         specified.
         """
-        all_files = os.listdir\
-            (f"Audio/{self._location[0]}/{self._location[1]}/")
-        if ".DS_Store" in all_files:
-            all_files.remove(".DS_Store")
-        return random.choice(all_files)
+        category = self._location[1]
+        picks = self._pick_buffer.get(category)
+
+        # Refill the buffer with a fresh batch of picks when it runs out
+        if not picks:
+            all_files = self._index.get(category)
+
+            # Categories missing from the startup index (ex: a directory
+            # created during the session) are scanned once here, leaving out
+            # hidden files such as the .DS_Store files present on macOS
+            if all_files is None:
+                with os.scandir\
+                    (f"Audio/{self._location[0]}/{category}/") as entries:
+                    all_files = tuple(entry.name for entry in entries \
+                        if not entry.name.startswith("."))
+                self._index[category] = all_files
+
+            picks = random.choices(all_files, k=16)
+            self._pick_buffer[category] = picks
+
+        return picks.pop()
 
     def play_audio(self):
         """
         Select and play the audio for a random file in the location specified
         by '_location'.
 
-        Pick a random file using the function 'pick_random_audio' and through
-        pygame's mixer, load and play the file for up to 6 seconds.
+        Pick a random preloaded sound for the location and play it for up to
+        6 seconds. The sounds are decoded once at session start (see
+        '_preload_sounds'), so no file is opened here. Playback happens in the
+        background through pygame's mixer, so this returns immediately and
+        listening can continue while the audio plays.
 
         Returns:
         A boolean representing whether a random audio file from the location
         was able to be played or not.
         """
-        # Load random file from location
-        location = self._location
-        file_name = self.pick_random_audio()
-
-        # Play the file for up to 6 seconds
-        pygame.mixer.music.load\
-            (f"Audio/{location[0]}/{location[1]}/{file_name}")
-
-        # Try playing the audio or else return False (exception)
+        # Initialize pygame's mixer with a pool of channels and decode the
+        # audio files the first time a cue actually plays, so sessions that
+        # never reach playback skip the audio start-up cost entirely
+        if not self._mixer_ready:
+            pygame.init()
+            pygame.mixer.init()
+            pygame.mixer.set_num_channels(8)
+            self._preload_sounds()
+            self._mixer_ready = True
+
+        # Pick a random preloaded sound from the location
+        sound = random.choice(self._sounds[self._location])
+
+        # Try playing the audio on a free channel (or the longest running one
+        # if all are busy) or else return False (pygame error)
         try:
-            pygame.mixer.music.play()
-            time.sleep(6)
+            channel = pygame.mixer.find_channel(True)
+            channel.play(sound, maxtime=6000)
             return True
-        except:
-            print("Couldn't play this file")
+        except pygame.error as error:
+            print(f"Couldn't play audio for {self._location[1]}: {error}")
             return False
 
 
@@ -203,14 +368,15 @@ class BookSession():
         """
         for key_and_word_group in key_to_word_list:
             key = key_and_word_group[0]
-            word = key_and_word_group[1]
 
-            # Add to the current list under the key if the key exists
-            if key in self._key_words:
-                self._key_words.get(key).append(word)
+            # Store cues lowercased so no per-text transformation is needed
+            # on the dictionary side when matching
+            word = key_and_word_group[1].lower()
 
-            # Create a new list under the new key if the key does not exist
-            else:
-                self._key_words[key] = [word]
+            # Add to the list under the key, creating it if it does not exist
+            self._key_words.setdefault(key, []).append(word)
+
+        # Mark the pattern stale; it is rebuilt lazily on the next check
+        self._pattern = None
 
         return self._key_words
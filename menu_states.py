@@ -3,6 +3,7 @@ Contains class to create a text-based menu for the reading session.
 """
 
 import os
+import subprocess
 
 class FairytaleMenu:
     """
@@ -35,19 +36,21 @@ class FairytaleMenu:
         representing the name of the text file for the book.
         """
 
-        real_book = False
-
-        while real_book is False:
+        while True:
 
             book_number = input("Select a book - type the number of the book"+\
                 " and press enter \n 1. Cinderella \n 2. The 3 Little Pigs\n"+\
                 " 3. General\n")
 
-            if int(book_number) == 1 or int(book_number) == 2 or \
-                int(book_number) == 3:
+            # Convert the input once, asking again if it is not a number
+            try:
+                book_index = int(book_number) - 1
+            except ValueError:
+                continue
 
-                book_title = self._menu_options[int(book_number)-1]
-                book_file = self._story_file[int(book_number)-1]
+            if 0 <= book_index < len(self._menu_options):
+                book_title = self._menu_options[book_index]
+                book_file = self._story_file[book_index]
                 return book_title, book_file
 
 
@@ -66,7 +69,17 @@ class FairytaleMenu:
         """
         self._menu = f"Great choice!  You are reading {book_title}.  Begin " +\
             "reading out loud now."
-        os.system(f"gedit {book_file} &")
+
+        # Open the story text in an editor directly, without going through a
+        # shell; with no display to open a window on, point the reader at the
+        # file instead
+        if os.environ.get("DISPLAY"):
+            subprocess.Popen(["gedit", book_file], \
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, \
+                stderr=subprocess.DEVNULL, close_fds=True)
+        else:
+            print(f"Open {book_file} to follow along with the story.")
+
         print(self._menu)
 
         return book_title
@@ -37,19 +37,19 @@ check_for_key_word_cases = [
 ]
 
 find_audio_location_cases = [
-    # Check that each key name returns the correct list representing the
+    # Check that each key name returns the correct tuple representing the
     # location of corresponding audio files for 'Music' related keys
-    ("Beginning", ["Music", "Beginning"]),
-    ("Sad", ["Music", "Sad"]),
-    # Check that each key name returns the correct list representing the
+    ("Beginning", ("Music", "Beginning")),
+    ("Sad", ("Music", "Sad")),
+    # Check that each key name returns the correct tuple representing the
     # location of corresponding audio files for 'Sound_Effects' related keys
-    ("Huff", ["Sound_Effects", "Huff"]),
-    ("Fire", ["Sound_Effects", "Fire"]),
-    ("Footsteps", ["Sound_Effects", "Footsteps"]),
-    ("Laughter", ["Sound_Effects", "Laughter"]),
-    ("Horse", ["Sound_Effects", "Horse"]),
-    ("Clock", ["Sound_Effects", "Clock"]),
-    ("Knock", ["Sound_Effects", "Knock"])
+    ("Huff", ("Sound_Effects", "Huff")),
+    ("Fire", ("Sound_Effects", "Fire")),
+    ("Footsteps", ("Sound_Effects", "Footsteps")),
+    ("Laughter", ("Sound_Effects", "Laughter")),
+    ("Horse", ("Sound_Effects", "Horse")),
+    ("Clock", ("Sound_Effects", "Clock")),
+    ("Knock", ("Sound_Effects", "Knock"))
 ]
 
 pick_random_audio_cases = [
@@ -165,12 +165,12 @@ def test_check_for_key_word(text, key_word):
 def test_find_audio_location(key, location):
     """
     Check that find_audio_location updates the _location variable for
-    BookSession with the correct list representing the location.
+    BookSession with the correct tuple representing the location.
 
     Args:
         key: A string representing the category name for the audio cue for which
             the location is to be found.
-        location: A list of two strings representing the directory location of
+        location: A tuple of two strings representing the directory location of
             the audio files corresponding to the category name (key) inputted.
     """
     book_sess = BookSession()